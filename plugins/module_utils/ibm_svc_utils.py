@@ -11,18 +11,34 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+import atexit
 import json
 import logging
+import os
+import ssl
+import socket
+import time
 import uuid
+import hashlib
 import inspect
+import tempfile
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 from ansible.module_utils.urls import open_url
-from ansible.module_utils.six.moves.urllib.parse import quote
+from ansible.module_utils.six.moves import http_client
+from ansible.module_utils.six.moves.urllib.parse import quote, urlparse
 from ansible.module_utils.six.moves.urllib.error import HTTPError
+from ansible.module_utils.six.moves.urllib.request import getproxies, proxy_bypass
 
 COLLECTION_VERSION = "2.4.1"
 TIMEOUT = 600
 
+# Controller side state (token cache etc.) of the collection is kept here
+STATE_DIR = os.path.join('~', '.ansible', 'ibm_storage_virtualize')
+TOKEN_CACHE_TTL = 1800
+
 
 def svc_argument_spec():
     """
@@ -86,6 +102,247 @@ def get_logger(module_name, log_file_name, log_level=logging.INFO):
     return log
 
 
+def env_to_bool(name, default=False):
+    '''
+    Returns the truth value of environment variable name, or default
+    when it is not set.
+    '''
+    value = os.environ.get(name)
+    if value is None or value == '':
+        return default
+    return bool(strtobool(value.lower()))
+
+
+def get_state_dir(name):
+    '''
+    Returns the path of the controller side state directory name, creating
+    it readable by the current user only if it does not exist.
+    '''
+    path = os.path.join(os.path.expanduser(STATE_DIR), name)
+    if not os.path.isdir(path):
+        os.makedirs(path, mode=0o700)
+    return path
+
+
+def write_private_file(path, data):
+    '''
+    Atomically replaces the file at path with data, readable by the
+    current user only.
+    '''
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix='.tmp')
+    try:
+        os.fchmod(fd, 0o600)
+        with os.fdopen(fd, 'w') as f:
+            f.write(data)
+        os.rename(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+class SVCTokenCache(object):
+    """ Stores REST API tokens on the controller so that they can be reused
+    across module invocations.
+
+    Tokens are kept in files readable by the current user only, one file per
+    combination of cluster, domain, username and password. Caching is
+    enabled by setting the environment variable IBM_SV_TOKEN_CACHE to true.
+    IBM_SV_TOKEN_CACHE_DIR and IBM_SV_TOKEN_CACHE_TTL (seconds) override the
+    cache location and the lifetime of a cached token.
+    """
+
+    def __init__(self, clustername, domain, username, password, cache_dir=None, ttl=TOKEN_CACHE_TTL):
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        key = '\0'.join([clustername or '', domain or '', username or '', password or ''])
+        self.filename = hashlib.sha256(key.encode('utf8')).hexdigest() + '.json'
+
+    @classmethod
+    def from_env(cls, clustername, domain, username, password):
+        '''
+        Returns a token cache configured from the environment, or None
+        when token caching is not enabled.
+        '''
+        if not env_to_bool('IBM_SV_TOKEN_CACHE'):
+            return None
+        ttl = int(os.environ.get('IBM_SV_TOKEN_CACHE_TTL') or TOKEN_CACHE_TTL)
+        return cls(clustername, domain, username, password,
+                   cache_dir=os.environ.get('IBM_SV_TOKEN_CACHE_DIR'), ttl=ttl)
+
+    @property
+    def path(self):
+        cache_dir = self.cache_dir or get_state_dir('tokens')
+        if not os.path.isdir(cache_dir):
+            os.makedirs(cache_dir, mode=0o700)
+        return os.path.join(cache_dir, self.filename)
+
+    def load(self):
+        '''
+        Returns the cached token, or None if there is no unexpired token.
+        '''
+        try:
+            with open(self.path) as f:
+                entry = json.load(f)
+        except (IOError, OSError, ValueError):
+            return None
+        if entry.get('expires', 0) <= time.time():
+            return None
+        return entry.get('token')
+
+    def save(self, token):
+        entry = {'token': token, 'expires': time.time() + self.ttl}
+        write_private_file(self.path, json.dumps(entry))
+
+    def invalidate(self):
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+
+class SVCConnectionError(Exception):
+    """ A pooled connection failed before a response was received """
+
+    def __init__(self, error, reused):
+        super(SVCConnectionError, self).__init__(str(error))
+        self.reused = reused
+
+
+class SVCConnectionPool(object):
+    """ Keeps HTTP(S) connections to the REST API open between commands
+
+    Connections are reused with HTTP keep-alive, so the TCP and TLS
+    handshakes are paid once per connection instead of once per command.
+    Idle connections are shared between threads; a connection is only used
+    by one request at a time.
+    """
+
+    def __init__(self, url, validate_certs, log):
+        parsed = urlparse(url)
+        self.scheme = parsed.scheme
+        self.host = parsed.hostname
+        self.port = parsed.port
+        self.validate_certs = validate_certs
+        self.log = log
+        self.idle = []
+        self.lock = threading.Lock()
+        self.handshakes = 0
+        self.requests = 0
+        self.ssl_context = None
+        if self.scheme == 'https':
+            if validate_certs:
+                self.ssl_context = ssl.create_default_context()
+            else:
+                self.ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+                self.ssl_context.check_hostname = False
+                self.ssl_context.verify_mode = ssl.CERT_NONE
+
+    @classmethod
+    def usable_for(cls, url):
+        '''
+        Returns whether connections to url can be pooled. Connections are
+        not pooled when a proxy would be used for url, or when
+        IBM_SV_REST_KEEPALIVE is set to false.
+        '''
+        if not env_to_bool('IBM_SV_REST_KEEPALIVE', default=True):
+            return False
+        parsed = urlparse(url)
+        if parsed.scheme not in ('http', 'https'):
+            return False
+        return parsed.scheme not in getproxies() or proxy_bypass(parsed.hostname)
+
+    def _connect(self, timeout):
+        if self.scheme == 'https':
+            conn = http_client.HTTPSConnection(self.host, self.port, timeout=timeout,
+                                               context=self.ssl_context)
+        else:
+            conn = http_client.HTTPConnection(self.host, self.port, timeout=timeout)
+        with self.lock:
+            self.handshakes += 1
+            self.log("SVCConnectionPool: opening connection to %s (connections=%d, requests=%d)",
+                     self.host, self.handshakes, self.requests)
+        return conn
+
+    def request(self, method, url, headers, body, timeout):
+        '''
+        Sends a request over an idle connection, or a new one if none is idle.
+        :returns: HTTP status, reason and response body
+        :rtype: tuple
+        '''
+        with self.lock:
+            self.requests += 1
+            conn = self.idle.pop() if self.idle else None
+        reused = conn is not None
+        if reused:
+            conn.timeout = timeout
+            if conn.sock is not None:
+                conn.sock.settimeout(timeout)
+        else:
+            conn = self._connect(timeout)
+
+        parsed = urlparse(url)
+        path = parsed.path + ('?' + parsed.query if parsed.query else '')
+        try:
+            conn.request(method, path, body=body, headers=headers)
+            response = conn.getresponse()
+            data = response.read()
+        except socket.timeout:
+            conn.close()
+            raise
+        except (socket.error, http_client.HTTPException) as e:
+            conn.close()
+            if reused:
+                # The system has probably closed idle connections
+                self.close()
+            raise SVCConnectionError(e, reused)
+        except Exception:
+            conn.close()
+            raise
+
+        if response.will_close:
+            conn.close()
+        else:
+            with self.lock:
+                self.idle.append(conn)
+        return response.status, response.reason, data
+
+    def close(self):
+        with self.lock:
+            idle, self.idle = self.idle, []
+        for conn in idle:
+            conn.close()
+
+    def report(self):
+        self.close()
+        self.log("SVCConnectionPool: %d requests sent over %d connections",
+                 self.requests, self.handshakes)
+
+
+def svc_run_concurrently(func, items, parallelism=1):
+    '''
+    Yields func(item) for every item, in the order of items.
+
+    At most parallelism calls are in flight at any time, so results can be
+    consumed as they arrive without queuing the whole workload. With a
+    parallelism of 1 the items are processed serially in the calling thread.
+    An exception raised by func is re-raised when its result is reached.
+    '''
+    if not parallelism or parallelism <= 1:
+        for item in items:
+            yield func(item)
+        return
+
+    with ThreadPoolExecutor(max_workers=parallelism) as executor:
+        pending = deque()
+        for item in items:
+            pending.append(executor.submit(func, item))
+            if len(pending) >= parallelism:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
 class IBMSVCRestApi(object):
     """ Communicate with SVC through RestApi
     SVC commands usually have the format
@@ -116,6 +373,11 @@ class IBMSVCRestApi(object):
         self.password = password
         self.validate_certs = validate_certs
         self.token = token
+        self.token_cache = None
+        self.token_from_cache = False
+        self.token_lock = threading.Lock()
+        self.rest_pool = None
+        self.rest_pool_broken = False
 
         # logging setup
         log = get_logger(self.__class__.__name__, log_path)
@@ -126,7 +388,14 @@ class IBMSVCRestApi(object):
             if not self.username or not self.password:
                 self.module.fail_json(msg="You must pass in either pre-acquired token"
                                           " or username/password to generate new token")
-            self.token = self._svc_authorize()
+            self.token_cache = SVCTokenCache.from_env(clustername, domain, username, password)
+            if self.token_cache:
+                self.token = self.token_cache.load()
+                self.token_from_cache = self.token is not None
+            if self.token_from_cache:
+                self.log("Using cached token")
+            else:
+                self.token = self._svc_authorize()
         else:
             self.log("Token already passed: %s", self.token)
 
@@ -197,6 +466,38 @@ class IBMSVCRestApi(object):
         r['data'] = cmdopts  # Original payload data has nicer formatting
         self.log("_svc_rest: payload=%s", payload)
 
+        pool = self._svc_rest_pool(url)
+        if pool:
+            try:
+                status, reason, body = pool.request(method, url, headers, bytes(data), timeout)
+            except socket.timeout as e:
+                self.log('_svc_rest: exception : %s', str(e))
+                r['err'] = "Exception %s", str(e)
+                return r
+            except SVCConnectionError as e:
+                # Send this command without the pool. A failure of a new
+                # connection disables the pool for the rest of the module.
+                self.log('_svc_rest: pooled connection failed: %s', str(e))
+                if not e.reused:
+                    self.rest_pool_broken = True
+            except Exception as e:
+                self.log('_svc_rest: exception : %s', str(e))
+                r['err'] = "Exception %s", str(e)
+                return r
+            else:
+                if status >= 400:
+                    error = 'HTTP Error %s: %s' % (status, reason)
+                    self.log('_svc_rest: httperror %s', error)
+                    r['code'] = status
+                    r['out'] = body
+                    r['err'] = "HTTPError %s", error
+                    return r
+                try:
+                    r['out'] = json.loads(body.decode('utf8'))
+                except ValueError as e:
+                    self.log("_svc_rest: value error pass: %s", str(e))
+                return r
+
         try:
             o = open_url(url, method=method, headers=headers, timeout=timeout,
                          validate_certs=self.validate_certs, data=bytes(data))
@@ -221,6 +522,21 @@ class IBMSVCRestApi(object):
         r['out'] = j
         return r
 
+    def _svc_rest_pool(self, url):
+        """ Returns the keep-alive connection pool to use for url, or None if
+        a new connection has to be opened with open_url
+        """
+        if self.rest_pool_broken:
+            return None
+        with self.token_lock:
+            if self.rest_pool is None:
+                if not SVCConnectionPool.usable_for(url):
+                    self.rest_pool_broken = True
+                    return None
+                self.rest_pool = SVCConnectionPool(url, self.validate_certs, self.log)
+                atexit.register(self.rest_pool.report)
+        return self.rest_pool
+
     def _svc_authorize(self):
         """ Obtain a token if we are authoized to connect
         :return: None or token string
@@ -252,6 +568,11 @@ class IBMSVCRestApi(object):
                                    cmdopts=rp_cmdopts, cmdargs=None)
                 except Exception as e:
                     pass
+                if self.token_cache:
+                    try:
+                        self.token_cache.save(out['token'])
+                    except Exception as e:
+                        self.log("Failed to cache token: %s", str(e))
                 return out['token']
 
         return None
@@ -273,14 +594,42 @@ class IBMSVCRestApi(object):
             self.module.fail_json(msg="No authorize token")
             # Abort
 
+        token = self.token
         headers = {
             'Content-Type': 'application/json',
-            'X-Auth-Token': self.token
+            'X-Auth-Token': token
         }
 
-        return self._svc_rest(method='POST', headers=headers, cmd=cmd,
+        rest = self._svc_rest(method='POST', headers=headers, cmd=cmd,
                               cmdopts=cmdopts, cmdargs=cmdargs, timeout=timeout)
 
+        if rest['code'] == 403 and self._svc_reauthorize(token):
+            headers['X-Auth-Token'] = self.token
+            rest = self._svc_rest(method='POST', headers=headers, cmd=cmd,
+                                  cmdopts=cmdopts, cmdargs=cmdargs, timeout=timeout)
+        return rest
+
+    def _svc_reauthorize(self, rejected_token):
+        """ Replace a cached token that has been rejected by the system
+        :param rejected_token: token the system responded to with HTTP 403
+        :type rejected_token: string
+        :returns: True if the command should be retried with a new token
+        """
+        with self.token_lock:
+            if self.token != rejected_token:
+                # Another thread has already replaced the token
+                return True
+            if not self.token_from_cache:
+                return False
+            self.log("Cached token has been rejected, obtaining a new token")
+            self.token_from_cache = False
+            self.token_cache.invalidate()
+            token = self._svc_authorize()
+            if not token:
+                return False
+            self.token = token
+            return True
+
     def svc_run_command(self, cmd, cmdopts, cmdargs, timeout=TIMEOUT):
         """ Generic execute a SVC command
         :param cmd: svc command to run
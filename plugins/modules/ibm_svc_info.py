@@ -180,6 +180,22 @@ options:
     - Specify to get information regarding any Storage Virtualize entities other than choices of gather_subset.
     - Exact command has to be specified to use command_list (i.e. lssystemcert, lstimezones, lsportset etc.).
     - Output will be stored in this way (i.e. lssystemcert -> Systemcert, lstimezones -> Timezones etc.).
+  parallelism:
+    description:
+    - Maximum number of entities from I(gather_subset) and I(command_list) that are listed concurrently.
+    - All the concurrent requests share the same REST API session.
+    - The returned information is the same as when the entities are listed one after another.
+    type: int
+    default: 1
+    version_added: '2.5.0'
+  detail_parallelism:
+    description:
+    - Maximum number of objects whose detailed view is fetched concurrently when I(objectname:"all") is specified.
+    - Detailed views are added to the result in the same order as the concise view lists the objects.
+    - Per object calls are skipped for commands whose detailed view is the same as the concise view.
+    type: int
+    default: 1
+    version_added: '2.5.0'
 notes:
     - This module supports C(check_mode).
     - If both I(gather_subset) and I(command_list) are not specified, ibm_svc_info will list information about I(default) objects.
@@ -257,6 +273,25 @@ EXAMPLES = '''
     gather_subset: [vol, host]
     command_list: [lsvdiskcopy, lssite]
     objectname: all
+- name: Get info of all entities, listing up to 8 entities at a time
+  ibm.storage_virtualize.ibm_svc_info:
+    clustername: "{{clustername}}"
+    domain: "{{domain}}"
+    username: "{{username}}"
+    password: "{{password}}"
+    log_path: /tmp/ansible.log
+    gather_subset: all
+    parallelism: 8
+- name: Get detailed info of all volumes, fetching 16 volumes at a time
+  ibm.storage_virtualize.ibm_svc_info:
+    clustername: "{{clustername}}"
+    domain: "{{domain}}"
+    username: "{{username}}"
+    password: "{{password}}"
+    log_path: /tmp/ansible.log
+    gather_subset: vol
+    objectname: all
+    detail_parallelism: 16
 '''
 
 RETURN = '''
@@ -809,11 +844,31 @@ Systempatches:
     sample: [{...}]
 '''
 
+import time
 from traceback import format_exc
 from ansible.module_utils.basic import AnsibleModule
-from ansible_collections.ibm.storage_virtualize.plugins.module_utils.ibm_svc_utils import IBMSVCRestApi, svc_argument_spec, get_logger
+from ansible_collections.ibm.storage_virtualize.plugins.module_utils.ibm_svc_utils import (
+    IBMSVCRestApi,
+    svc_argument_spec,
+    get_logger,
+    svc_run_concurrently
+)
 from ansible.module_utils._text import to_native
 
+# Commands for which the detailed view of an object is the same as its
+# entry in the concise view
+CONCISE_VIEW_COMMANDS = frozenset([
+    'lsfcportsetmember',
+    'lsportset',
+    'lsprovisioningpolicy',
+    'lsquorum',
+    'lstargetportfc',
+    'lstruststore',
+    'lsusergrp',
+    'lsvolumegrouppopulation',
+    'lsvolumegroupsnapshotpolicy'
+])
+
 
 class IBMSVCGatherInfo(object):
     def __init__(self):
@@ -894,7 +949,9 @@ class IBMSVCGatherInfo(object):
                                             'systempatches',
                                             'all'
                                             ]),
-                command_list=dict(type='list', elements='str', required=False)
+                command_list=dict(type='list', elements='str', required=False),
+                parallelism=dict(type='int', default=1),
+                detail_parallelism=dict(type='int', default=1)
             )
         )
 
@@ -908,6 +965,10 @@ class IBMSVCGatherInfo(object):
         self.objectname = self.module.params['objectname']
         self.filtervalue = self.module.params['filtervalue']
         self.command_list = self.module.params['command_list']
+        self.parallelism = self.module.params['parallelism']
+        self.detail_parallelism = self.module.params['detail_parallelism']
+        # Commands found to have the same concise and detailed views
+        self.concise_view_cmds = set()
 
         self.basic_checks()
 
@@ -923,6 +984,10 @@ class IBMSVCGatherInfo(object):
         )
 
     def basic_checks(self):
+        if self.parallelism < 1:
+            self.module.fail_json(msg="parallelism must be a positive integer")
+        if self.detail_parallelism < 1:
+            self.module.fail_json(msg="detail_parallelism must be a positive integer")
         if self.command_list == ["all"]:
             self.module.fail_json(msg="command_list parameter cannot be specified as 'all'")
         if self.subset == ["all"] and self.objectname == "all":
@@ -972,6 +1037,16 @@ class IBMSVCGatherInfo(object):
         )
         return op_key
 
+    def detailed_views(self, cmd, object_ids):
+        '''
+        Yields the detailed view of each object in object_ids, fetching
+        up to detail_parallelism views at a time.
+        '''
+        def detailed_view(object_id):
+            return self.restapi.svc_obj_info(cmd=cmd, cmdopts=None, cmdargs=[object_id])
+
+        return svc_run_concurrently(detailed_view, object_ids, self.detail_parallelism)
+
     def get_list(self, subset, op_key, cmd, validate):
         try:
             svc_obj_out = None
@@ -1039,38 +1114,41 @@ class IBMSVCGatherInfo(object):
                                 for obj in get_all_objects:
                                     list_object.append(obj[id_name])
                                 if len(list_object) == len(set(list_object)):  # Those commands in which all ids are unique (ex. lsmdisk, lsvdisk etc)
-                                    cnt = 0
-                                    for object_id in list_object:
-                                        op_key_list.append(self.restapi.svc_obj_info(cmd=cmd,
-                                                                                     cmdopts=None,
-                                                                                     cmdargs=[object_id]))
-                                        if cnt == 0:
-                                            cnt += 1
-                                            '''
-                                            Checking in first iteration only,
-                                            whether id can be specifed with command or not (lscommand <id>)
-                                            '''
-                                            first_object = op_key_list[0]
-                                            if not first_object:
-                                                output[op_key] = get_all_objects
-                                                '''
-                                                If output is None (i.e. lscommand <id> is invalid), return concise output,
-                                                No need to iterate over loop (ex. lscompatibilitymode, lscopystatus,
-                                                lsfcmapcandidate, lsfcportcandidate, lsfeature, lsiogrpcandidate,
-                                                lsrcrelationshipcandidate, lssite, lssystemlimits,  lstimezones,
-                                                lsvdiskanalysisprogress etc.)
-                                                '''
-                                                return output
-                                            elif len(get_all_objects[0]) == len(first_object):
-                                                output[op_key] = get_all_objects
-                                                '''
-                                                If output is equal to concise output, then break the loop and return concise output,
-                                                further iteration not required (ex. lsfcportsetmember, lsportset,
-                                                lsprovisioningpolicy, lsquorum, lssystemsupportcenter, lstargetportfc,
-                                                lstruststore, lsusergrp, lsvolumegrouppopulation, lsvolumegroupsnapshotpolicy,
-                                                lsvolumegroupsnapshotschedule etc.)
-                                                '''
-                                                return output
+                                    if cmd in CONCISE_VIEW_COMMANDS or cmd in self.concise_view_cmds:
+                                        output[op_key] = get_all_objects
+                                        '''
+                                        Detailed view of these commands is known to be equal to the concise output,
+                                        so per object calls are skipped.
+                                        '''
+                                        return output
+                                    first_object = self.restapi.svc_obj_info(cmd=cmd,
+                                                                             cmdopts=None,
+                                                                             cmdargs=[list_object[0]])
+                                    '''
+                                    Checking with first object only,
+                                    whether id can be specifed with command or not (lscommand <id>)
+                                    '''
+                                    if not first_object:
+                                        output[op_key] = get_all_objects
+                                        '''
+                                        If output is None (i.e. lscommand <id> is invalid), return concise output,
+                                        No need to iterate over loop (ex. lscompatibilitymode, lscopystatus,
+                                        lsfcmapcandidate, lsfcportcandidate, lsfeature, lsiogrpcandidate,
+                                        lsrcrelationshipcandidate, lssite, lssystemlimits,  lstimezones,
+                                        lsvdiskanalysisprogress etc.)
+                                        '''
+                                        return output
+                                    elif len(get_all_objects[0]) == len(first_object):
+                                        self.concise_view_cmds.add(cmd)
+                                        output[op_key] = get_all_objects
+                                        '''
+                                        If output is equal to concise output, then skip the loop and return concise output,
+                                        further iteration not required (ex. lssystemsupportcenter,
+                                        lsvolumegroupsnapshotschedule etc.)
+                                        '''
+                                        return output
+                                    op_key_list.append(first_object)
+                                    op_key_list.extend(self.detailed_views(cmd, list_object[1:]))
                                     output[op_key] = op_key_list
                                 else:
                                     output[op_key] = get_all_objects
@@ -1113,6 +1191,14 @@ class IBMSVCGatherInfo(object):
             self.log.error(msg)
             self.module.fail_json(msg=msg)
 
+    def timed_get_list(self, job):
+        key, value_tuple = job
+        start = time.time()
+        op = self.get_list(key, *value_tuple[:3])
+        self.log.info("Listed %s using %s in %.3f seconds", key, value_tuple[1],
+                      time.time() - start)
+        return op
+
     def apply(self):
         subset = self.subset
         command_list = self.command_list
@@ -1278,6 +1364,7 @@ class IBMSVCGatherInfo(object):
         else:
             current_set = subset
         build_version = ''
+        jobs = []
         for key in current_set:
             value_tuple = cmd_mappings[key]
             if subset == ['all']:
@@ -1299,7 +1386,9 @@ class IBMSVCGatherInfo(object):
                             break
                     if not flag:
                         continue
-            op = self.get_list(key, *value_tuple[:3])
+            jobs.append((key, value_tuple))
+
+        for op in svc_run_concurrently(self.timed_get_list, jobs, self.parallelism):
             result.update(op)
 
         self.module.exit_json(**result)
@@ -9,12 +9,41 @@
 
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
+import os
+import shutil
+import threading
+import stat
+import tempfile
 import unittest
 import json
 from mock import patch
 from ansible.module_utils import basic
+from ansible.module_utils.six.moves.BaseHTTPServer import HTTPServer, BaseHTTPRequestHandler
 from ansible.module_utils._text import to_bytes
-from ansible_collections.ibm.storage_virtualize.plugins.module_utils.ibm_svc_utils import IBMSVCRestApi
+from ansible_collections.ibm.storage_virtualize.plugins.module_utils.ibm_svc_utils import (
+    IBMSVCRestApi,
+    SVCTokenCache,
+    svc_run_concurrently
+)
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers['Content-Length']))
+        if self.path.endswith('/lsmissing'):
+            body = b'CMMVC5753E The specified object does not exist.'
+            self.send_response(500)
+        else:
+            body = json.dumps([{'id': '0', 'path': self.path}]).encode('utf8')
+            self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
 
 
 def set_module_args(args):
@@ -168,6 +197,86 @@ class TestIBMSVModuleUtils(unittest.TestCase):
         self.assertEqual(ret, "CMMVC5707E An invalid or duplicated parameter, unaccompanied argument, or "
                          "incorrect argument sequence has been detected. Ensure that the input is as per the help.")
 
+    def test_svc_run_concurrently_keeps_order(self):
+        ret = list(svc_run_concurrently(lambda x: x * 2, range(10), 4))
+        self.assertEqual(ret, [x * 2 for x in range(10)])
+
+    def test_svc_run_concurrently_serial(self):
+        ret = list(svc_run_concurrently(lambda x: x + 1, [1, 2, 3]))
+        self.assertEqual(ret, [2, 3, 4])
+
+    def test_token_cache_save_and_load(self):
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir)
+        cache = SVCTokenCache('1.2.3.4', None, 'username', 'password', cache_dir=cache_dir)
+        self.assertIsNone(cache.load())
+        cache.save('token1')
+        self.assertEqual(cache.load(), 'token1')
+        self.assertEqual(stat.S_IMODE(os.stat(cache.path).st_mode), 0o600)
+        # A different password must not reuse the token
+        other = SVCTokenCache('1.2.3.4', None, 'username', 'other', cache_dir=cache_dir)
+        self.assertIsNone(other.load())
+        cache.invalidate()
+        self.assertIsNone(cache.load())
+
+    def test_token_cache_expired_token(self):
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir)
+        cache = SVCTokenCache('1.2.3.4', None, 'username', 'password', cache_dir=cache_dir, ttl=-1)
+        cache.save('token1')
+        self.assertIsNone(cache.load())
+
+    @patch('ansible_collections.ibm.storage_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_rest')
+    @patch('ansible_collections.ibm.storage_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_cached_token_reauthorize_on_403(self, mock_svc_authorize, mock_svc_rest):
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir)
+        SVCTokenCache('1.2.3.4', 'domain.ibm.com', 'username', 'password',
+                      cache_dir=cache_dir).save('cached')
+        env = {'IBM_SV_TOKEN_CACHE': 'true', 'IBM_SV_TOKEN_CACHE_DIR': cache_dir}
+        with patch.dict(os.environ, env):
+            restapi = IBMSVCRestApi(self.mock_module_helper, '1.2.3.4',
+                                    'domain.ibm.com', 'username', 'password',
+                                    False, 'test.log', None)
+        mock_svc_authorize.assert_not_called()
+        self.assertEqual(restapi.token, 'cached')
+
+        mock_svc_authorize.return_value = 'fresh'
+        mock_svc_rest.side_effect = [
+            {'code': 403, 'err': 'HTTPError', 'out': b''},
+            {'code': None, 'err': None, 'out': []}
+        ]
+        rest = restapi._svc_token_wrap('lshost', None, None)
+        self.assertEqual(rest['out'], [])
+        self.assertEqual(restapi.token, 'fresh')
+        self.assertEqual(mock_svc_rest.call_args[1]['headers']['X-Auth-Token'], 'fresh')
+        mock_svc_authorize.assert_called_once_with()
+
+    def test_svc_rest_reuses_connection(self):
+        server = HTTPServer(('127.0.0.1', 0), KeepAliveHandler)
+        thread = threading.Thread(target=server.serve_forever)
+        thread.daemon = True
+        thread.start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+
+        set_module_args(self.set_default_args())
+        self.restapi.module = basic.AnsibleModule(argument_spec=dict(
+            clustername=dict(type='str'), domain=dict(type='str'), state=dict(type='str'),
+            username=dict(type='str'), password=dict(type='str', no_log=True)))
+        self.restapi._resturl = 'http://127.0.0.1:%d/rest' % server.server_address[1]
+        self.restapi.token = 'token'
+        for i in range(3):
+            rest = self.restapi._svc_token_wrap('lshost', None, [str(i)])
+            self.assertEqual(rest['out'][0]['path'], '/rest/lshost/%d' % i)
+        rest = self.restapi._svc_token_wrap('lsmissing', None, None)
+        self.assertEqual(rest['code'], 500)
+        self.restapi.rest_pool.close()
+        self.assertEqual(self.restapi.rest_pool.requests, 4)
+        self.assertEqual(self.restapi.rest_pool.handshakes, 1)
+
 
 if __name__ == '__main__':
     unittest.main()
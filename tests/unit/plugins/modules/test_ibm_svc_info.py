@@ -1090,6 +1090,103 @@ class TestIBMSVCGatherInfo(unittest.TestCase):
             IBMSVCGatherInfo().apply()
         self.assertEqual(exc.value.args[0]['msg'], "filtervalue must be accompanied with a single object either in gather_subset or command_list")
 
+    @patch('ansible_collections.ibm.storage_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_obj_info')
+    @patch('ansible_collections.ibm.storage_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_gather_info_with_parallelism(self, svc_authorize_mock,
+                                          svc_obj_info_mock):
+        set_module_args({
+            'clustername': 'clustername',
+            'domain': 'domain',
+            'username': 'username',
+            'password': 'password',
+            'gather_subset': ['host', 'vol', 'pool', 'node'],
+            'parallelism': 3,
+        })
+        outputs = {
+            'lshost': [{"id": "1", "name": "host0"}],
+            'lsvdisk': [{"id": "0", "name": "vol0"}],
+            'lsmdiskgrp': [{"id": "0", "name": "pool0"}],
+            'lsnode': [{"id": "1", "name": "node1"}]
+        }
+        svc_obj_info_mock.side_effect = lambda cmd, cmdopts, cmdargs: outputs[cmd]
+        with pytest.raises(AnsibleExitJson) as exc:
+            IBMSVCGatherInfo().apply()
+        self.assertFalse(exc.value.args[0]['changed'])
+        self.assertEqual(exc.value.args[0]['Host'], outputs['lshost'])
+        self.assertEqual(exc.value.args[0]['Volume'], outputs['lsvdisk'])
+        self.assertEqual(exc.value.args[0]['Pool'], outputs['lsmdiskgrp'])
+        self.assertEqual(exc.value.args[0]['Node'], outputs['lsnode'])
+        self.assertEqual(svc_obj_info_mock.call_count, 4)
+
+    @patch('ansible_collections.ibm.storage_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_fail_invalid_parallelism(self, svc_authorize_mock):
+        set_module_args({
+            'clustername': 'clustername',
+            'domain': 'domain',
+            'username': 'username',
+            'password': 'password',
+            'gather_subset': 'host',
+            'parallelism': 0,
+        })
+
+        with pytest.raises(AnsibleFailJson) as exc:
+            IBMSVCGatherInfo().apply()
+        self.assertEqual(exc.value.args[0]['msg'], "parallelism must be a positive integer")
+
+    @patch('ansible_collections.ibm.storage_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_obj_info')
+    @patch('ansible_collections.ibm.storage_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_objectname_all_with_detail_parallelism(self, svc_authorize_mock,
+                                                    svc_obj_info_mock):
+        set_module_args({
+            'clustername': 'clustername',
+            'domain': 'domain',
+            'username': 'username',
+            'password': 'password',
+            'gather_subset': 'vol',
+            'objectname': 'all',
+            'detail_parallelism': 4,
+        })
+        concise = [{"id": str(i), "name": "vol%d" % i} for i in range(10)]
+
+        def obj_info(cmd, cmdopts, cmdargs):
+            if not cmdargs:
+                return concise
+            return {"id": cmdargs[0], "name": "vol%s" % cmdargs[0], "capacity": "1.00GB"}
+
+        svc_obj_info_mock.side_effect = obj_info
+        with pytest.raises(AnsibleExitJson) as exc:
+            IBMSVCGatherInfo().apply()
+        self.assertEqual([vol['id'] for vol in exc.value.args[0]['Volume']],
+                         [vol['id'] for vol in concise])
+        self.assertTrue(all('capacity' in vol for vol in exc.value.args[0]['Volume']))
+        self.assertEqual(svc_obj_info_mock.call_count, 11)
+
+    @patch('ansible_collections.ibm.storage_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi.svc_obj_info')
+    @patch('ansible_collections.ibm.storage_virtualize.plugins.module_utils.'
+           'ibm_svc_utils.IBMSVCRestApi._svc_authorize')
+    def test_objectname_all_skips_detailed_view_for_concise_commands(self, svc_authorize_mock,
+                                                                     svc_obj_info_mock):
+        set_module_args({
+            'clustername': 'clustername',
+            'domain': 'domain',
+            'username': 'username',
+            'password': 'password',
+            'command_list': 'lsportset',
+            'objectname': 'all',
+        })
+        portsets = [{"id": "0", "name": "portset0"}, {"id": "1", "name": "portset64"}]
+        svc_obj_info_mock.return_value = portsets
+        with pytest.raises(AnsibleExitJson) as exc:
+            IBMSVCGatherInfo().apply()
+        self.assertEqual(exc.value.args[0]['Portset'], portsets)
+        svc_obj_info_mock.assert_called_once_with(cmd='lsportset', cmdopts=None, cmdargs=None)
+
 
 if __name__ == '__main__':
     unittest.main()